@@ -1,17 +1,28 @@
 """Redis Dict module."""
-from typing import Any, Dict, Iterator, List, Tuple, Union, Optional, Type
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union, Optional, Type, cast
 
 from datetime import timedelta
+from itertools import chain, islice
 from contextlib import contextmanager
 from collections.abc import Mapping
 
 from redis import StrictRedis
 
 from .type_management import SENTINEL, EncodeFuncType, DecodeFuncType, EncodeType, DecodeType
-from .type_management import _create_default_encode, _create_default_decode, _default_decoder
+from .type_management import _create_default_encode, _create_default_decode
 from .type_management import encoding_registry as enc_reg
 from .type_management import decoding_registry as dec_reg
 
+# Keep the TTL of an existing key, otherwise set the key with the expiration from ARGV[2] if given.
+_SET_PRESERVE_EXPIRATION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('SET', KEYS[1], ARGV[1], 'KEEPTTL')
+elseif ARGV[2] ~= '' then
+    return redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+end
+return redis.call('SET', KEYS[1], ARGV[1])
+"""
+
 
 # pylint: disable=R0902, R0904
 class RedisDict:
@@ -47,6 +58,7 @@ class RedisDict:
              preserve_expiration: Optional[bool] = False,
              redis: "Optional[StrictRedis[Any]]" = None,
              raise_key_error_delete: bool = False,
+             scan_count: int = 1000,
              **redis_kwargs: Any) -> None:  # noqa: D202:R0913 pydocstyle clashes with Sphinx
         """
         Initialize a RedisDict instance.
@@ -59,10 +71,14 @@ class RedisDict:
             preserve_expiration (Optional[bool], optional): Preserve expiration on key updates.
             redis (Optional[StrictRedis[Any]], optional): A Redis connection instance.
             raise_key_error_delete (bool): Enable strict Python dict behavior raise if key not found when deleting.
+            scan_count (int): COUNT hint for the SCAN commands that walk the whole namespace, such as len and clear.
+                Higher values mean fewer round trips, but each SCAN call blocks Redis a little longer.
             **redis_kwargs (Any): Additional kwargs for Redis connection if not provided.
         """
 
         self.namespace: str = namespace
+        self._prefix: str = f'{namespace}:'
+        self._prefix_len: int = len(self._prefix)
         self.expire: Union[int, timedelta, None] = expire
         self.preserve_expiration: Optional[bool] = preserve_expiration
         self.raise_key_error_delete: bool = raise_key_error_delete
@@ -71,15 +87,19 @@ class RedisDict:
 
         self.redis: StrictRedis[Any] = redis or StrictRedis(decode_responses=True, **redis_kwargs)
         self.get_redis: StrictRedis[Any] = self.redis
+        self._set_preserve_expiration: Any = self.redis.register_script(_SET_PRESERVE_EXPIRATION_SCRIPT)
 
         self.custom_encode_method = "encode"
         self.custom_decode_method = "decode"
 
-        self._iter: Iterator[str] = iter([])
+        self._iter: Optional[Iterator[str]] = None
         self._max_string_size: int = 500 * 1024 * 1024  # 500mb
         self._temp_redis: Optional[StrictRedis[Any]] = None
         self._insertion_order_key = f"redis-dict-insertion-order-{namespace}"
         self._batch_size: int = 200
+        self._scan_count: int = scan_count
+        self._max_repr_items: int = 100
+        self._pipeline_flush_size: int = 10000
 
     def _format_key(self, key: str) -> str:
         """
@@ -91,7 +111,7 @@ class RedisDict:
         Returns:
             str: The formatted key with the namespace prefix.
         """
-        return f'{self.namespace}:{key}'
+        return f'{self._prefix}{key}'
 
     def _parse_key(self, key: str) -> str:
         """
@@ -103,7 +123,7 @@ class RedisDict:
         Returns:
             str: The parsed key
         """
-        return key[len(self.namespace) + 1:]
+        return key[self._prefix_len:]
 
     def _valid_input(self, value: Any) -> bool:
         """
@@ -119,8 +139,7 @@ class RedisDict:
         Returns:
             bool: True if the input value is valid, False otherwise.
         """
-        store_type = type(value).__name__
-        if store_type == "str":
+        if type(value) is str:  # pylint: disable=unidiomatic-typecheck
             return len(value) < self._max_string_size
         return True
 
@@ -134,12 +153,18 @@ class RedisDict:
             str: The formatted value with the type and encoded representation of the value.
         """
         store_type = type(value).__name__
-        encoded_value = self.encoding_registry.get(store_type, lambda x: x)(value)  # type: ignore
+        encode = self.encoding_registry.get(store_type)
+        encoded_value = value if encode is None else encode(value)
         return f'{store_type}:{encoded_value}'
 
     def _store_set(self, formatted_key: str, formatted_value: str) -> None:
-        if self.preserve_expiration and self.get_redis.exists(formatted_key):
-            self.redis.set(formatted_key, formatted_value, keepttl=True)
+        if self.preserve_expiration:
+            expire = int(self.expire.total_seconds()) if isinstance(self.expire, timedelta) else self.expire
+            self._set_preserve_expiration(
+                keys=[formatted_key],
+                args=[formatted_value, '' if expire is None else expire],
+                client=self.redis,
+            )
         else:
             self.redis.set(formatted_key, formatted_value, ex=self.expire)
 
@@ -170,6 +195,72 @@ class RedisDict:
 
         self._store_set(formatted_key, formatted_value)
 
+    def _store_batch(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Store multiple key-value pairs in Redis within a single pipeline.
+
+        When _use_mset allows it, the pairs are written with one MSET per batch of self._batch_size keys.
+        Otherwise each pair is stored individually with _store. Either way, when a pair fails validation,
+        the pairs before it are still written, as with dict.update.
+        When no pipeline was open yet, the queued commands are flushed every self._pipeline_flush_size pairs.
+
+        Args:
+            items (Iterable[Tuple[str, Any]]): The key-value pairs to store.
+
+        Raises:
+            ValueError: If a value or key fail validation.
+        """
+        flush = self._temp_redis is None
+        with self.pipeline():
+            if flush:
+                items = self._flush_every(items)
+            if not self._use_mset():
+                for key, value in items:
+                    self._store(key, value)
+                return
+
+            valid_input, format_key, format_value = self._valid_input, self._format_key, self._format_value
+            mset, batch_size = self.redis.mset, self._batch_size
+            batch: Dict[Union[str, bytes], Union[bytes, float, int, str]] = {}
+            try:
+                for key, value in items:
+                    if not valid_input(value) or not valid_input(key):
+                        raise ValueError("Invalid input value or key size exceeded the maximum limit.")
+                    batch[format_key(key)] = format_value(value)
+                    if len(batch) >= batch_size:
+                        mset(batch)
+                        batch = {}
+            finally:
+                if batch:
+                    mset(batch)
+
+    def _use_mset(self) -> bool:
+        """
+        Check whether _store_batch can write pairs with MSET, which only holds without an expiration to set or preserve.
+
+        Returns:
+            bool: True if the pairs can be written with MSET.
+        """
+        return self.expire is None and not self.preserve_expiration
+
+    def _flush_every(self, items: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the given pairs, executing the open pipeline after every self._pipeline_flush_size pairs.
+
+        Keeps the commands queued on the client bounded for large batches. Should only wrap pairs
+        stored inside a pipeline opened by the caller itself, as each flush ends the transaction.
+
+        Args:
+            items (Iterable[Tuple[str, Any]]): The key-value pairs to store.
+
+        Yields:
+            Iterator[Tuple[str, Any]]: The same key-value pairs.
+        """
+        for count, item in enumerate(items, 1):
+            yield item
+            if count % self._pipeline_flush_size == 0:
+                self.redis.execute()  # type: ignore
+
     def _load(self, key: str) -> Tuple[bool, Any]:
         """
         Load a value from Redis with the given key.
@@ -194,9 +285,18 @@ class RedisDict:
 
         Returns:
             Any: The transformed Python object.
+
+        Raises:
+            ValueError: If the result is not prefixed with its type.
         """
-        type_, value = result.split(':', 1)
-        return self.decoding_registry.get(type_, _default_decoder)(value)
+        type_, sep, value = result.partition(':')
+        if not sep:
+            raise ValueError(f"Stored value is missing its type prefix: {result!r}")
+        try:
+            decode = self.decoding_registry[type_]
+        except KeyError:
+            return value
+        return decode(value)
 
     def new_type_compliance(
             self,
@@ -313,6 +413,8 @@ class RedisDict:
         """
         Compare the current RedisDict with another object.
 
+        When the other object is a RedisDict, its values are fetched in batches with get_many.
+
         Args:
             other (Any): The object to compare with.
 
@@ -321,6 +423,14 @@ class RedisDict:
         """
         if len(self) != len(other):
             return False
+        if isinstance(other, RedisDict):
+            items = self.items()
+            while True:
+                batch = dict(islice(items, self._batch_size))
+                if not batch:
+                    return True
+                if other.get_many(batch) != batch:
+                    return False
         for key, value in self.items():
             if value != other.get(key, SENTINEL):
                 return False
@@ -351,10 +461,10 @@ class RedisDict:
         Raises:
             KeyError: If the key is not found.
         """
-        found, value = self._load(item)
-        if not found:
+        result = self.get_redis.get(self._format_key(item))
+        if result is None:
             raise KeyError(item)
-        return value
+        return self._transform(result)
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
@@ -386,7 +496,7 @@ class RedisDict:
             KeyError: Only if dict_compliant=True and key doesn't exist
         """
         formatted_key = self._format_key(key)
-        result = self.redis.delete(formatted_key)
+        result = self.redis.unlink(formatted_key)
         if self.raise_key_error_delete and not result:
             raise KeyError(key)
 
@@ -400,7 +510,7 @@ class RedisDict:
         Returns:
             bool: True if the key exists, False otherwise.
         """
-        return self._load(key)[0]
+        return bool(self.get_redis.exists(self._format_key(key)))
 
     def __len__(self) -> int:
         """
@@ -415,20 +525,29 @@ class RedisDict:
         """
         Return an iterator over the keys of the RedisDict, analogous to a dictionary.
 
+        Every call returns a new generator, so nested and concurrent loops over the same RedisDict
+        do not share state.
+
         Returns:
             Iterator[str]: An iterator over the keys of the RedisDict.
         """
-        self._iter = self.keys()
-        return self
+        return self.keys()
 
     def __repr__(self) -> str:
         """
         Create a string representation of the RedisDict.
 
+        Only the first self._max_repr_items items are fetched and shown, followed by '...' when there are more.
+        Use str() for the complete contents.
+
         Returns:
             str: A string representation of the RedisDict.
         """
-        return str(self)
+        preview = list(islice(self.items(), self._max_repr_items + 1))
+        if len(preview) <= self._max_repr_items:
+            return str(dict(preview))
+        shown = ', '.join(f'{key!r}: {value!r}' for key, value in preview[:self._max_repr_items])
+        return f'{{{shown}, ...}}'
 
     def __str__(self) -> str:
         """
@@ -536,10 +655,23 @@ class RedisDict:
         """
         Get the next item in the iterator.
 
+        Kept for backwards compatibility, this steps through a key iterator held on the instance,
+        independent of the iterators returned by __iter__. Calling iter() on the RedisDict no longer resets it.
+        Instead, once all keys have been returned it raises StopIteration, and the next call starts a new pass.
+
         Returns:
             str: The next item in the iterator.
+
+        Raises:
+            StopIteration: When all keys have been returned, after which the next call starts over.
         """
-        return next(self._iter)
+        if self._iter is None:
+            self._iter = self.keys()
+        try:
+            return next(self._iter)
+        except StopIteration:
+            self._iter = None
+            raise
 
     def next(self) -> str:
         """
@@ -571,20 +703,21 @@ class RedisDict:
             >>> print(query)
             'foo:bar*'
         """
-        return f'{self.namespace}:{search_term}*'
+        return f'{self._prefix}{search_term}*'
 
     def _scan_keys(self, search_term: str = '', full_scan: bool = False) -> Iterator[str]:
         """Scan for Redis keys matching the given search term.
 
         Args:
             search_term (str): A search term to filter keys. Defaults to ''.
-            full_scan (bool): During full scan uses batches of self._batch_size by default 200
+            full_scan (bool): Scan the whole namespace in larger batches of self._scan_count,
+                by default 1000, instead of self._batch_size, by default 200.
 
         Returns:
             Iterator[str]: An iterator of matching Redis keys.
         """
         search_query = self._create_iter_query(search_term)
-        count = None if full_scan else self._batch_size
+        count = self._scan_count if full_scan else self._batch_size
         return self.get_redis.scan_iter(match=search_query, count=count)
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
@@ -604,14 +737,38 @@ class RedisDict:
             return default
         return item
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the values for the given keys, fetched with MGET in batches of self._batch_size.
+
+        Keys that are not found are left out of the result.
+
+        Args:
+            keys (Iterable[str]): The keys to retrieve the values for.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the found keys and their values.
+        """
+        result = {}
+        key_list = list(keys)
+        mget = self.get_redis.mget
+        format_key = self._format_key
+        transform = self._transform
+        for start in range(0, len(key_list), self._batch_size):
+            batch = key_list[start:start + self._batch_size]
+            values = mget([format_key(key) for key in batch])
+            for key, value in zip(batch, values):
+                if value is not None:
+                    result[key] = transform(value)
+        return result
+
     def keys(self) -> Iterator[str]:
         """Return an Iterator of keys in the RedisDict, analogous to a dictionary's keys method.
 
         Returns:
             Iterator[str]: A list of keys in the RedisDict.
         """
-        to_rm = len(self.namespace) + 1
-        return (str(item[to_rm:]) for item in self._scan_keys())
+        to_rm = self._prefix_len
+        return (item[to_rm:] for item in self._scan_keys())
 
     def key(self, search_term: str = '') -> Optional[str]:
         """Return the first value for search_term if it exists, otherwise return None.
@@ -622,11 +779,9 @@ class RedisDict:
         Returns:
             str: The first key associated with the given search term.
         """
-        to_rm = len(self.namespace) + 1
         search_query = self._create_iter_query(search_term)
-        _, data = self.get_redis.scan(match=search_query, count=1)
-        for item in data:
-            return str(item[to_rm:])
+        for item in self.get_redis.scan_iter(match=search_query, count=self._batch_size):
+            return str(item[self._prefix_len:])
 
         return None
 
@@ -636,12 +791,9 @@ class RedisDict:
         Yields:
             Iterator[Tuple[str, Any]]: A list of key-value pairs in the RedisDict.
         """
-        to_rm = len(self.namespace) + 1
-        for item in self._scan_keys():
-            try:
-                yield str(item[to_rm:]), self[item[to_rm:]]
-            except KeyError:
-                pass
+        to_rm = self._prefix_len
+        for formatted_key, value in self._scan_items():
+            yield formatted_key[to_rm:], value
 
     def values(self) -> Iterator[Any]:
         """Analogous to a dictionary's values method.
@@ -651,12 +803,39 @@ class RedisDict:
         Yields:
             List[Any]: A list of values in the RedisDict.
         """
-        to_rm = len(self.namespace) + 1
-        for item in self._scan_keys():
-            try:
-                yield self[item[to_rm:]]
-            except KeyError:
-                pass
+        for _, value in self._scan_items():
+            yield value
+
+    def _scan_items(self) -> Iterator[Tuple[str, Any]]:
+        """Scan for the keys in the namespace and load their values with one MGET per batch of self._batch_size keys.
+
+        Keys that are removed between the scan and the MGET are skipped.
+
+        Yields:
+            Iterator[Tuple[str, Any]]: The formatted keys and their values.
+        """
+        batch = []
+        for formatted_key in self._scan_keys():
+            batch.append(formatted_key)
+            if len(batch) >= self._batch_size:
+                yield from self._load_formatted(batch)
+                batch = []
+        if batch:
+            yield from self._load_formatted(batch)
+
+    def _load_formatted(self, formatted_keys: List[str]) -> Iterator[Tuple[str, Any]]:
+        """Load the values for the given formatted keys with a single MGET.
+
+        Args:
+            formatted_keys (List[str]): The formatted keys to load.
+
+        Yields:
+            Iterator[Tuple[str, Any]]: The formatted keys that were found and their values.
+        """
+        transform = self._transform
+        for formatted_key, result in zip(formatted_keys, self.get_redis.mget(formatted_keys)):
+            if result is not None:
+                yield formatted_key, transform(result)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the RedisDict to a Python dictionary.
@@ -675,8 +854,26 @@ class RedisDict:
 
         """
         with self.pipeline():
-            for key in self._scan_keys(full_scan=True):
-                self.redis.delete(key)
+            self._delete_keys(self._scan_keys(full_scan=True))
+
+    def _delete_keys(self, keys: Iterable[str]) -> None:
+        """Delete the given Redis keys, issuing one multi-key command per batch of self._batch_size keys.
+
+        Uses UNLINK, which removes the keys immediately but reclaims their memory in a background thread.
+
+        Args:
+            keys (Iterable[str]): The formatted Redis keys to delete.
+        """
+        unlink = self.redis.unlink
+        batch_size = self._batch_size
+        batch = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) >= batch_size:
+                unlink(*batch)
+                batch = []
+        if batch:
+            unlink(*batch)
 
     def _pop(self, formatted_key: str) -> Any:
         """
@@ -738,18 +935,16 @@ class RedisDict:
             except KeyError:
                 continue
 
-    def _create_set_get_command(self, formatted_key: str, formatted_value: str) -> Tuple[List[str], Dict[str, bool]]:
-        """Create SET command arguments and options for Redis. For setdefault operation.
+    def _create_set_get_command(self, formatted_key: str, formatted_value: str) -> List[str]:
+        """Create SET command arguments for Redis. For setdefault operation.
 
         Args:
             formatted_key (str): The formatted Redis key.
             formatted_value (str): The formatted value to be set.
 
         Returns:
-            Tuple[List[str], Dict[str, bool]]: A tuple containing the command arguments and options.
+            List[str]: The command arguments, to be sent with the get=True option.
         """
-        # Setting {"get": True} enables parsing of the redis result as "GET", instead of "SET" command
-        options = {"get": True}
         args = ["SET", formatted_key, formatted_value, "NX", "GET"]
         if self.preserve_expiration:
             args.append("KEEPTTL")
@@ -757,7 +952,7 @@ class RedisDict:
             expire_val = int(self.expire.total_seconds()) if isinstance(self.expire, timedelta) else self.expire
             expire_str = str(1) if expire_val <= 1 else str(expire_val)
             args.extend(["EX", expire_str])
-        return args, options
+        return args
 
     def setdefault(self, key: str, default_value: Optional[Any] = None) -> Any:
         """Get value under key, and if not present set default value.
@@ -775,8 +970,9 @@ class RedisDict:
         formatted_key = self._format_key(key)
         formatted_value = self._format_value(default_value)
 
-        args, options = self._create_set_get_command(formatted_key, formatted_value)
-        result = self.get_redis.execute_command(*args, **options)
+        args = self._create_set_get_command(formatted_key, formatted_value)
+        # Setting get=True enables parsing of the redis result as "GET", instead of "SET" command
+        result = self.get_redis.execute_command(*args, get=True)
 
         if result is None:
             return default_value
@@ -796,16 +992,33 @@ class RedisDict:
         """
         return self.to_dict()
 
-    def update(self, dic: Dict[str, Any]) -> None:
+    def update(self, *args: Union['Mapping[str, Any]', Iterable[Tuple[str, Any]]], **kwargs: Any) -> None:
         """
         Update the RedisDict with key-value pairs from the given mapping, analogous to a dictionary's update method.
 
+        All writes are sent in a single pipeline, see _store_batch.
+        The mapping is taken positionally, as with dict.update, so any keyword is stored as a key.
+
         Args:
-            dic (Mapping[str, Any]): A mapping containing key-value pairs to update the RedisDict.
-        """
-        with self.pipeline():
-            for key, value in dic.items():
-                self[key] = value
+            *args (Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]): At most one mapping, or iterable of
+                key-value pairs, to update the RedisDict with.
+            **kwargs (Any): Additional key-value pairs to update the RedisDict with.
+
+        Raises:
+            TypeError: If more than one positional argument is given.
+        """
+        if len(args) > 1:
+            raise TypeError(f"update expected at most 1 argument, got {len(args)}")
+        dic = args[0] if args else ()
+        items: Iterable[Tuple[str, Any]]
+        if isinstance(dic, (Mapping, RedisDict)):
+            items = dic.items()
+        elif hasattr(dic, 'keys'):
+            mapping = cast('Mapping[str, Any]', dic)
+            items = ((key, mapping[key]) for key in mapping.keys())
+        else:
+            items = dic
+        self._store_batch(chain(items, kwargs.items()))
 
     def fromkeys(self, iterable: List[str], value: Optional[Any] = None) -> 'RedisDict':
         """Create a new RedisDict from an iterable of key-value pairs.
@@ -813,8 +1026,7 @@ class RedisDict:
         Create a new RedisDict with keys from the provided iterable and values set to the given value.
         This method is analogous to the `fromkeys` method of a standard Python dictionary, populating
         the RedisDict with the keys from the iterable and setting their corresponding values to the
-        specified value.
-
+        specified value. The keys are written in batches, see update.
 
         Args:
             iterable (List[str]): An iterable containing the keys to be added to the RedisDict.
@@ -824,8 +1036,7 @@ class RedisDict:
             RedisDict: The current RedisDict instance,populated with the keys from the iterable and their
             corresponding values.
         """
-        for key in iterable:
-            self[key] = value
+        self._store_batch((key, value) for key in iterable)
         return self
 
     def __sizeof__(self) -> int:
@@ -917,7 +1128,8 @@ class RedisDict:
         found_keys = list(self._scan_keys(key))
         if len(found_keys) == 0:
             return []
-        return [self._transform(i) for i in self.redis.mget(found_keys) if i is not None]
+        transform = self._transform
+        return [transform(i) for i in self.redis.mget(found_keys) if i is not None]
 
     def multi_chain_get(self, keys: List[str]) -> List[Any]:
         """
@@ -945,24 +1157,35 @@ class RedisDict:
         if len(keys) == 0:
             return {}
         to_rm = keys[0].rfind(':') + 1
+        transform = self._transform
         return dict(
-            zip([i[to_rm:] for i in keys], (self._transform(i) for i in self.redis.mget(keys) if i is not None))
+            zip([i[to_rm:] for i in keys], (transform(i) for i in self.redis.mget(keys) if i is not None))
         )
 
     def multi_del(self, key: str) -> int:
         """
         Delete multiple values from the RedisDict using a shared key prefix.
 
+        Keys are removed with UNLINK, which reclaims their memory in a background thread, in batches of
+        self._batch_size keys sent together in a single pipeline. Inside pipeline(), the batches are queued
+        on that pipeline and run in order with the other queued commands when it exits.
+
         Args:
             key (str): The shared key prefix.
 
         Returns:
-            int: The number of keys deleted.
+            int: The number of keys deleted, or inside pipeline() the number of keys queued for deletion.
         """
         keys = list(self._scan_keys(key))
         if len(keys) == 0:
             return 0
-        return self.redis.delete(*keys)
+        if self._temp_redis is not None:
+            self._delete_keys(keys)
+            return len(keys)
+        pipe = self.get_redis.pipeline(transaction=False)
+        for start in range(0, len(keys), self._batch_size):
+            pipe.unlink(*keys[start:start + self._batch_size])
+        return sum(pipe.execute())
 
     def get_redis_info(self) -> Dict[str, Any]:
         """
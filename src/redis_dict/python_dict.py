@@ -32,11 +32,13 @@ class PythonRedisDict(RedisDict):
     By delegating serialization to redis-dict, reduce complexity and have simple code in the codebase.
     """
 
+    # pylint: disable=R0913
     def __init__(self,
                  namespace: str = 'main',
                  expire: Union[int, timedelta, None] = None,
                  preserve_expiration: Optional[bool] = False,
                  redis: "Optional[StrictRedis[Any]]" = None,
+                 scan_count: int = 1000,
                  **redis_kwargs: Any) -> None:  # noqa: D202 pydocstyle clashes with Sphinx
         """
         Initialize a RedisDict instance.
@@ -48,6 +50,8 @@ class PythonRedisDict(RedisDict):
             expire (Union[int, timedelta, None], optional): Expiration time for keys.
             preserve_expiration (Optional[bool], optional): Preserve expiration on key updates.
             redis (Optional[StrictRedis[Any]], optional): A Redis connection instance.
+            scan_count (int): COUNT hint for the SCAN commands that walk the whole namespace,
+                and for the ZSCAN over the insertion order.
             **redis_kwargs (Any): Additional kwargs for Redis connection if not provided.
         """
         super().__init__(
@@ -56,6 +60,7 @@ class PythonRedisDict(RedisDict):
             preserve_expiration=preserve_expiration,
             redis=redis,
             raise_key_error_delete=True,
+            scan_count=scan_count,
             **redis_kwargs
         )
         self._insertion_order_key = f"redis-dict-insertion-order-{namespace}"
@@ -81,7 +86,7 @@ class PythonRedisDict(RedisDict):
         """
         formatted_key = self._format_key(key)
 
-        result = self.redis.delete(formatted_key)
+        result = self.redis.unlink(formatted_key)
         self._insertion_order_delete(formatted_key)
         if not result:
             raise KeyError(key)
@@ -115,6 +120,15 @@ class PythonRedisDict(RedisDict):
             self._insertion_order_add(formatted_key)
             self._store_set(formatted_key, formatted_value)
 
+    def _use_mset(self) -> bool:
+        """
+        Never batch writes with MSET, each pair is stored individually to record its insertion order.
+
+        Returns:
+            bool: Always False.
+        """
+        return False
+
     def setdefault(self, key: str, default_value: Optional[Any] = None) -> Any:
         """Get value under key, and if not present set default value.
 
@@ -132,8 +146,9 @@ class PythonRedisDict(RedisDict):
         formatted_value = self._format_value(default_value)
 
         # Todo bind both commands
-        args, options = self._create_set_get_command(formatted_key, formatted_value)
-        result = self.get_redis.execute_command(*args, **options)
+        args = self._create_set_get_command(formatted_key, formatted_value)
+        # Setting get=True enables parsing of the redis result as "GET", instead of "SET" command
+        result = self.get_redis.execute_command(*args, get=True)
         self._insertion_order_add(formatted_key)
 
         if result is None:
@@ -163,8 +178,7 @@ class PythonRedisDict(RedisDict):
         """
         with self.pipeline():
             self._insertion_order_clear()
-            for key in self._scan_keys(full_scan=True):
-                self.redis.delete(key)
+            self._delete_keys(self._scan_keys(full_scan=True))
 
     def popitem(self) -> Tuple[str, Any]:
         """Remove and return a random (key, value) pair from the RedisDict as a tuple.
@@ -295,7 +309,7 @@ class PythonRedisDict(RedisDict):
             cursor, data = self.get_redis.zscan(
                 name=self._insertion_order_key,
                 cursor=cursor,
-                count=1
+                count=self._scan_count
             )
             yield from (item[0] for item in data)
 
@@ -307,7 +321,7 @@ class PythonRedisDict(RedisDict):
         Returns:
             bool: True if the insertion order was successfully cleared, False otherwise.
         """
-        return bool(self.redis.delete(self._insertion_order_key))
+        return bool(self.redis.unlink(self._insertion_order_key))
 
     def _insertion_order_len(self) -> int:
         """Get the number of keys in the insertion order tracking.
@@ -216,6 +216,12 @@ class RedisDictJSONDecoder(json.JSONDecoder):
         super().__init__(object_hook=_object_hook, *args, **kwargs)
 
 
+# Shared instances, like json's own module-level default encoder and decoder,
+# instead of constructing a new encoder or decoder (and scanner) on every call.
+_json_encoder = RedisDictJSONEncoder()
+_json_decoder = RedisDictJSONDecoder()
+
+
 def encode_json(obj: Any) -> str:
     """
     Encode a Python object to a JSON string using the existing encoding registry.
@@ -226,7 +232,7 @@ def encode_json(obj: Any) -> str:
     Returns:
         str: The JSON-encoded string representation of the object.
     """
-    return json.dumps(obj, cls=RedisDictJSONEncoder)
+    return _json_encoder.encode(obj)
 
 
 def decode_json(s: str) -> Any:
@@ -239,7 +245,7 @@ def decode_json(s: str) -> Any:
     Returns:
         Any: The decoded Python object.
     """
-    return json.loads(s, cls=RedisDictJSONDecoder)
+    return _json_decoder.decode(s)
 
 
 def _default_decoder(x: str) -> str:
@@ -11,7 +11,6 @@ BATCH_SIZE = 1000
 import os
 import csv
 import zipfile
-import requests
 from typing import Iterator, Dict
 from io import TextIOWrapper
 import gzip
@@ -81,13 +80,11 @@ import gzip
 import csv
 from typing import Iterator, Dict
 from io import TextIOWrapper
-import requests
 from urllib.parse import urlparse
+from urllib.request import urlretrieve
 
 def download_file(url: str, filename: str):
-    response = requests.get(url)
-    with open(filename, 'wb') as f:
-        f.write(response.content)
+    urlretrieve(url, filename)
 
 def csv_iterator(file) -> Iterator[Dict[str, str]]:
     reader = csv.DictReader(file)
@@ -25,6 +25,13 @@ redis_config = {
 }
 
 
+def _unlink_namespace(redisdb):
+    """Unlink all keys under the test namespace prefix in one call."""
+    keys = list(redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX), count=1000))
+    if keys:
+        redisdb.unlink(*keys)
+
+
 def skip_before_python39(test_item):
     """
     Decorator to skip tests for Python versions before 3.9
@@ -67,8 +74,7 @@ class TestRedisDictBehaviorDict(unittest.TestCase):
     def clear_test_namespace(cls):
         cls.redisdb.flushdb()  # TODO Remove flush make sure everything is deleted.
         cls.redisdb.delete(f"redis-dict-insertion-order-{TEST_NAMESPACE_PREFIX}")
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
     def setUp(self):
         self.clear_test_namespace()
@@ -245,6 +251,78 @@ class TestRedisDictBehaviorDict(unittest.TestCase):
         self.assertEqual(len(dic), 5)
         self.assertEqual(len(input_items), 5)
 
+    def test_dict_method_update_pairs_and_kwargs(self):
+        redis_dic = self.create_redis_dict()
+        dic = dict()
+
+        input_pairs = [("int", 1), ("str", "im a string")]
+
+        redis_dic.update(input_pairs, float=0.9, bool=True)
+        dic.update(input_pairs, float=0.9, bool=True)
+        self.assertEqual(redis_dic.to_dict(), dic)
+
+        redis_dic.update(none=None)
+        dic.update(none=None)
+        self.assertEqual(redis_dic.to_dict(), dic)
+
+    def test_dict_method_update_invalid_value_keeps_earlier_pairs(self):
+        redis_dic = self.create_redis_dict()
+        redis_dic._max_string_size = 5
+
+        with self.assertRaises(ValueError):
+            redis_dic.update([("k1", 1), ("k2", 2), ("bad", "toolongvalue")])
+        self.assertEqual(redis_dic.to_dict(), {"k1": 1, "k2": 2})
+
+    def test_dict_method_update_duck_typed_mapping(self):
+        class KeysOnly:
+            def __init__(self, data):
+                self.data = data
+
+            def keys(self):
+                return self.data.keys()
+
+            def __getitem__(self, key):
+                return self.data[key]
+
+        redis_dic = self.create_redis_dict()
+        dic = dict()
+
+        input_items = {"int": 1, "str": "im a string"}
+
+        redis_dic.update(KeysOnly(input_items))
+        dic.update(KeysOnly(input_items))
+        self.assertEqual(redis_dic.to_dict(), dic)
+
+    def test_dict_method_update_keyword_named_dic(self):
+        redis_dic = self.create_redis_dict()
+        dic = dict()
+
+        redis_dic.update({"x": 1}, dic=2)
+        dic.update({"x": 1}, dic=2)
+        self.assertEqual(redis_dic.to_dict(), dic)
+
+        redis_dic.update(dic=3)
+        dic.update(dic=3)
+        self.assertEqual(redis_dic.to_dict(), dic)
+
+    def test_dict_method_update_too_many_arguments(self):
+        redis_dic = self.create_redis_dict()
+
+        with self.assertRaises(TypeError):
+            redis_dic.update({"x": 1}, {"y": 2})
+        with self.assertRaises(TypeError):
+            dict().update({"x": 1}, {"y": 2})
+        self.assertEqual(redis_dic.to_dict(), {})
+
+    def test_dict_method_update_flushes_pipeline(self):
+        redis_dic = self.create_redis_dict()
+        redis_dic._pipeline_flush_size = 7
+        redis_dic._batch_size = 3
+
+        input_items = {"key{}".format(i): i for i in range(50)}
+        redis_dic.update(input_items)
+        self.assertEqual(redis_dic.to_dict(), input_items)
+
     def test_dict_method_pop(self):
         redis_dic = self.create_redis_dict()
         dic = dict()
@@ -1211,8 +1289,7 @@ class TestRedisDict(unittest.TestCase):
 
     @classmethod
     def clear_test_namespace(cls):
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
     def setUp(self):
         self.clear_test_namespace()
@@ -1242,6 +1319,40 @@ class TestRedisDict(unittest.TestCase):
 
         self.assertEqual(self.r['foobar'], 'barbar')
 
+    def test_popitem_with_keys_outside_namespace(self):
+        """Test popitem finds the key when most keys in Redis belong to another namespace."""
+        other = self.create_redis_dict(namespace=TEST_NAMESPACE_PREFIX + '_other')
+        self.addCleanup(other.clear)
+        other.update({str(i): i for i in range(100)})
+
+        self.r['foo'] = 'bar'
+        self.assertEqual(self.r.key(), 'foo')
+        self.assertEqual(self.r.popitem(), ('foo', 'bar'))
+        with self.assertRaises(KeyError):
+            self.r.popitem()
+
+    def test_get_value_without_type_prefix(self):
+        """Test reading a value stored without a type prefix raises instead of losing data."""
+        self.redisdb.set('{}:raw'.format(self.r.namespace), 'no prefix')
+        with self.assertRaises(ValueError):
+            self.r['raw']
+
+    def test_key_search_term(self):
+        """Test key() only returns keys matching the search term."""
+        self.r['apple'] = 1
+        self.r['banana'] = 2
+        self.assertEqual(self.r.key('ban'), 'banana')
+        self.assertIsNone(self.r.key('zzz'))
+
+    def test_get_many(self):
+        """Test retrieving multiple keys at once, missing keys are left out."""
+        self.assertEqual(self.r.get_many([]), {})
+
+        expected = {'key{}'.format(i): i for i in range(self.r._batch_size + 5)}
+        self.r.update(expected)
+
+        self.assertEqual(self.r.get_many(list(expected) + ['missing']), expected)
+
     def test_set_none_and_get_none(self):
         """Test setting a key with no value and retrieving it."""
         self.r['foobar'] = None
@@ -1320,6 +1431,18 @@ class TestRedisDict(unittest.TestCase):
         result = repr(self.r)
         self.assertEqual(result, expected)
 
+    def test_repr_truncated(self):
+        """Tests the __repr__ function only shows the first items of a large RedisDict."""
+        redis_dic = self.create_redis_dict()
+        redis_dic._max_repr_items = 2
+        redis_dic.update({'a': 1, 'b': 2, 'c': 3})
+
+        result = repr(redis_dic)
+        self.assertTrue(result.startswith('{'))
+        self.assertTrue(result.endswith(', ...}'))
+        self.assertEqual(result.count(': '), 2)
+        self.assertEqual(str(redis_dic), str(redis_dic.to_dict()))
+
     def test_str_nonempty(self):
         """Tests the __repr__ function with keys set."""
         key = 'foobar'
@@ -1385,6 +1508,15 @@ class TestRedisDict(unittest.TestCase):
         actual_ttl = self.redisdb.ttl('{}:foobar'.format(self.r.namespace))
         self.assertAlmostEqual(3600, actual_ttl, delta=2)
 
+    def test_expire_keyword_update(self):
+        """Test updating multiple keys with an `expire` value set by the `expire` config keyword."""
+        r = self.create_redis_dict(expire=3600)
+
+        r.update({'foo': 'bar', 'foobar': 'barbar'})
+        self.assertEqual(r.to_dict(), {'foo': 'bar', 'foobar': 'barbar'})
+        actual_ttl = self.redisdb.ttl('{}:foobar'.format(self.r.namespace))
+        self.assertAlmostEqual(3600, actual_ttl, delta=2)
+
     def test_expire_keyword_timedelta(self):
         """ Test adding keys with an `expire` value by using the `expire` config keyword. With timedelta as argument."""
         timedelta_one_hour = timedelta(hours=1)
@@ -1417,6 +1549,26 @@ class TestRedisDict(unittest.TestCase):
         for key in self.r:
             self.assertEqual(self.r[key], key_values[key])
 
+    def test_next_starts_over_once_exhausted(self):
+        """Tests next() on the RedisDict steps through the keys and starts a new pass after StopIteration."""
+        self.r['foobar1'] = 'barbar1'
+
+        self.assertEqual(next(self.r), 'foobar1')
+        with self.assertRaises(StopIteration):
+            next(self.r)
+        self.assertEqual(self.r.next(), 'foobar1')
+
+    def test_iter_nested(self):
+        """Tests that nested loops over the same RedisDict use independent iterators."""
+        key_values = {
+            'foobar1': 'barbar1',
+            'foobar2': 'barbar2',
+        }
+        self.r.update(key_values)
+
+        pairs = {(outer, inner) for outer in self.r for inner in self.r}
+        self.assertEqual(pairs, {(outer, inner) for outer in key_values for inner in key_values})
+
     # TODO behavior of multi and chain methods should be discussed.
     # TODO python 2 couldn't skip
     # @unittest.skip
@@ -1647,8 +1799,7 @@ class TestPythonRedisDict(TestRedisDict):
     def clear_test_namespace(cls):
         cls.redisdb.flushdb()
         cls.redisdb.delete(f"redis-dict-insertion-order-{TEST_NAMESPACE_PREFIX}")
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
 
 class TestRedisDictSecurity(unittest.TestCase):
@@ -1669,8 +1820,7 @@ class TestRedisDictSecurity(unittest.TestCase):
 
     @classmethod
     def clear_test_namespace(cls):
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
     def setUp(self):
         self.clear_test_namespace()
@@ -1786,8 +1936,7 @@ class TestPythonRedisDictSecurity(TestRedisDictSecurity):
     def clear_test_namespace(cls):
         cls.redisdb.flushdb()
         cls.redisdb.delete(f"redis-dict-insertion-order-{TEST_NAMESPACE_PREFIX}")
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
 
 class TestRedisDictComparison(unittest.TestCase):
@@ -1845,6 +1994,16 @@ class TestRedisDictComparison(unittest.TestCase):
         self.assertEqual(empty_r, {})
         empty_r.clear()
 
+    def test_eq_empty_with_non_mapping(self):
+        empty_r = RedisDict(namespace="test_empty")
+        # Only the lengths are compared when there are no items, as before the batched comparison.
+        for other in ([], "", (), set()):
+            self.assertTrue(empty_r == other)
+            self.assertFalse(empty_r != other)
+        for other in ([1], "a", (1,), {1}):
+            self.assertFalse(empty_r == other)
+            self.assertTrue(empty_r != other)
+
     def test_eq_nested_empty(self):
         nested_empty_r = RedisDict(namespace="test_nested_empty")
         nested_empty_r.update({"a": {}})
@@ -2054,8 +2213,7 @@ class TestRedisDictPreserveExpire(unittest.TestCase):
     @classmethod
     def clear_test_namespace(cls):
         cls.redisdb.delete(f"redis-dict-insertion-order-{TEST_NAMESPACE_PREFIX}")
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
     def setUp(self):
         self.clear_test_namespace()
@@ -2092,6 +2250,50 @@ class TestRedisDictPreserveExpire(unittest.TestCase):
         # Ensure the difference between the TTLs of "foo" and "bar" is at least 2 seconds.
         self.assertTrue(abs(actual_ttl_foo - actual_ttl_bar) >= 1)
 
+    def test_preserve_expiration_without_expire(self):
+        """Test preserve_expiration without expire, new keys get no TTL and existing keys keep theirs."""
+        redis_dict = self.create_redis_dict(preserve_expiration=True)
+
+        redis_dict["foo"] = "bar"
+        self.assertEqual(redis_dict["foo"], "bar")
+        self.assertIsNone(redis_dict.get_ttl("foo"))
+
+        self.redisdb.expire('{}:foo'.format(redis_dict.namespace), 100)
+        redis_dict["foo"] = "value"
+        self.assertEqual(redis_dict["foo"], "value")
+        self.assertAlmostEqual(100, redis_dict.get_ttl("foo"), delta=1)
+
+    def test_preserve_expiration_timedelta(self):
+        """Test preserve_expiration with expire given as a timedelta."""
+        redis_dict = self.create_redis_dict(expire=timedelta(minutes=10), preserve_expiration=True)
+
+        redis_dict["foo"] = "bar"
+        self.assertAlmostEqual(600, redis_dict.get_ttl("foo"), delta=1)
+
+        self.redisdb.expire('{}:foo'.format(redis_dict.namespace), 100)
+        redis_dict["foo"] = "value"
+        self.assertEqual(redis_dict["foo"], "value")
+        self.assertAlmostEqual(100, redis_dict.get_ttl("foo"), delta=1)
+
+    def test_preserve_expiration_in_pipeline(self):
+        """Test preserve_expiration checks for existing keys when the pipeline executes."""
+        redis_dict = self.create_redis_dict(expire=3600, preserve_expiration=True)
+
+        redis_dict["foo"] = "bar"
+        redis_dict["baz"] = "qux"
+        self.redisdb.expire('{}:foo'.format(redis_dict.namespace), 100)
+        self.redisdb.expire('{}:baz'.format(redis_dict.namespace), 100)
+
+        with redis_dict.pipeline():
+            redis_dict["foo"] = "value"
+            del redis_dict["baz"]
+            redis_dict["baz"] = "recreated"
+
+        self.assertEqual(redis_dict["foo"], "value")
+        self.assertAlmostEqual(100, redis_dict.get_ttl("foo"), delta=1)
+        self.assertEqual(redis_dict["baz"], "recreated")
+        self.assertAlmostEqual(3600, redis_dict.get_ttl("baz"), delta=1)
+
     def test_preserve_expiration_not_used(self):
         """Test preserve_expiration configuration parameter."""
         redis_dict = self.create_redis_dict(expire=3600)
@@ -2136,8 +2338,7 @@ class TestPythonRedisDictPreserveExpire(TestRedisDictPreserveExpire):
     def clear_test_namespace(cls):
         cls.redisdb.flushdb()
         cls.redisdb.delete(f"redis-dict-insertion-order-{TEST_NAMESPACE_PREFIX}")
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
 
 class TestRedisDictMulti(unittest.TestCase):
@@ -2158,8 +2359,7 @@ class TestRedisDictMulti(unittest.TestCase):
 
     @classmethod
     def clear_test_namespace(cls):
-        for key in cls.redisdb.scan_iter('{}:*'.format(TEST_NAMESPACE_PREFIX)):
-            cls.redisdb.delete(key)
+        _unlink_namespace(cls.redisdb)
 
     def setUp(self):
         self.clear_test_namespace()
@@ -2250,6 +2450,25 @@ class TestRedisDictMulti(unittest.TestCase):
         self.assertIsNone(self.redisdb.get('foobaz'))
         self.assertEqual(self.r['goobar'], 'borbor')
 
+    def test_multi_del_multiple_batches(self):
+        """Tests the multi_del function with more keys than fit in a single batch."""
+        count = self.r._batch_size * 2 + 1
+        self.r.update({'foo:{}'.format(i): i for i in range(count)})
+        self.r['goobar'] = 'borbor'
+        self.assertEqual(self.r.multi_del('foo'), count)
+        self.assertEqual(list(self.r.keys()), ['goobar'])
+
+    def test_multi_del_in_pipeline(self):
+        """Tests multi_del inside pipeline() runs in order with the other queued commands."""
+        for count in (2, self.r._batch_size * 2 + 1):
+            self.r.update({'foo:{}'.format(i): i for i in range(count)})
+            with self.r.pipeline():
+                self.r['foo:0'] = 'rewritten'
+                self.assertEqual(self.r.multi_del('foo'), count)
+                self.r['foo:after'] = 'after'
+            self.assertEqual(list(self.r.keys()), ['foo:after'])
+            self.r.clear()
+
     def test_chain_set_2(self):
         """Test setting a chain with 2 elements."""
         self.r.chain_set(['foo', 'bar'], 'melons')
@@ -30,9 +30,10 @@ class Customer:
 
 
 class BaseRedisDictTest(unittest.TestCase):
-    def setUp(self):
-        self.redis_dict = RedisDict()
-        self.redis_dict_seperator = ":"
+    @classmethod
+    def setUpClass(cls):
+        cls.redis_dict = RedisDict()
+        cls.redis_dict_seperator = ":"
 
     def tearDown(self):
         self.redis_dict.clear()
@@ -189,7 +190,13 @@ class EncryptedRot13String(str):
     >>> assert type(encrypted_string) == EncryptedRot13String
     >>> assert isinstance(encrypted_string, str)
     """
-    pass
+    __slots__ = ()
+
+
+_ROT13_TABLE = str.maketrans(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "nopqrstuvwxyzabcdefghijklmNOPQRSTUVWXYZABCDEFGHIJKLM",
+)
 
 
 def rot13(s):
@@ -205,14 +212,14 @@ def rot13(s):
 
     Example:
         >>> rot13("Hello, World!")
-        "uryyb, jbeyq!"
-        >>> rot13("uryyb, jbeyq!")
-        "hello, world!"
+        "Uryyb, Jbeyq!"
+        >>> rot13("Uryyb, Jbeyq!")
+        "Hello, World!"
 
     For more information:
         https://en.wikipedia.org/wiki/ROT13
     """
-    return ''.join([chr((ord(c) - 97 + 13) % 26 + 97) if c.isalpha() else c for c in s.lower()])
+    return s.translate(_ROT13_TABLE)
 
 
 def rot13_encode(encrypted_rot13_str: EncryptedRot13String):
@@ -280,7 +287,7 @@ class TestRedisDictExtendTypesEncodingDecoding(BaseRedisDictTest):
 
     def test_encoding_decoding_should_remain_equal(self):
         """Test adding new type and test if encoding and decoding results in the same value"""
-        redis_dict = RedisDict()
+        redis_dict = self.redis_dict
         redis_dict.extends_type(EncryptedRot13String, rot13_encode, rot13_decode)
 
         key = "foo"